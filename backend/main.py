@@ -1,28 +1,53 @@
 """
 TOON Chat Backend - FastAPI + LangChain + Gemini
 Uses standard TOON format for efficient token usage with LLMs
-Includes conversation history persistence in TOON format
+Includes append-only conversation history persistence (one JSONL log per session)
 """
 
-import os
+import re
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
+import aiofiles
+import aiofiles.os
+import orjson
+
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_settings import BaseSettings
 
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 # Load environment variables
 load_dotenv()
 
+
+class Settings(BaseSettings):
+    """Application settings, read from the environment once at startup"""
+    google_api_key: Optional[str] = None
+    gemini_model: str = "gemini-2.5-flash"
+    log_level: str = "INFO"
+    allowed_origins: str = "http://localhost:3000"
+    history_window_size: int = 10
+    batch_max_concurrency: int = 5
+    max_cached_sessions: int = 256
+    host: str = "0.0.0.0"
+    port: int = 8000
+
+
+settings = Settings()
+
 # Configure comprehensive logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVEL = settings.log_level.upper()
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL),
     format='%(asctime)s - %(name)s - %(levelname)s - [%(funcName)s:%(lineno)d] - %(message)s',
@@ -37,30 +62,38 @@ try:
     TOON_AVAILABLE = True
 except ImportError:
     logger.warning("⚠️  python-toon not installed, using JSON fallback")
-    import json
-    encode = lambda x: json.dumps(x)
-    decode = lambda x: json.loads(x) if isinstance(x, str) else x
+    encode = lambda x: orjson.dumps(x).decode()
+    decode = lambda x: orjson.loads(x) if isinstance(x, (str, bytes)) else x
     TOON_AVAILABLE = False
 
 # Startup banner
 logger.info("=" * 80)
 logger.info("🚀 TOON Chat Backend Starting")
-logger.info(f"📦 Model: {os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')}")
-logger.info(f"🔧 Log Level: {LOG_LEVEL}")
-logger.info(f"📊 TOON Format: {'Enabled' if TOON_AVAILABLE else 'Disabled (JSON fallback)'}")
-logger.info(f"🪟 Message Window: {os.getenv('HISTORY_WINDOW_SIZE', '10')} messages")
+logger.info("📦 Model: %s", settings.gemini_model)
+logger.info("🔧 Log Level: %s", LOG_LEVEL)
+logger.info("📊 TOON Format: %s", 'Enabled' if TOON_AVAILABLE else 'Disabled (JSON fallback)')
+logger.info("🪟 Message Window: %s messages", settings.history_window_size)
 logger.info("=" * 80)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up shared resources on startup and flush pending history on shutdown"""
+    init_llm()
+    await start_history_writer()
+    yield
+    await stop_history_writer()
+
+
 app = FastAPI(
     title="TOON Chat API",
     description="Efficient chat API using TOON format for 30-60% token reduction",
-    version="2.1.0"
+    version="2.1.0",
+    lifespan=lifespan
 )
 
 # CORS configuration
-allowed_origins_str = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000")
-allowed_origins = [origin.strip() for origin in allowed_origins_str.split(",")]
-logger.info(f"🌐 CORS Allowed Origins: {allowed_origins}")
+allowed_origins = [origin.strip() for origin in settings.allowed_origins.split(",")]
+logger.info("🌐 CORS Allowed Origins: %s", allowed_origins)
 
 app.add_middleware(
     CORSMiddleware,
@@ -70,28 +103,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Chat history file path
-HISTORY_FILE = Path("chat_history_toon.txt")
-logger.info(f"💾 History File: {HISTORY_FILE.absolute()}")
+# Chat history directory (one append-only JSONL file per session)
+HISTORY_DIR = Path("chat_history/")
+HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+logger.info("💾 History Directory: %s", HISTORY_DIR.absolute())
 
 
 # Request/Response models with validation
 class ChatRequest(BaseModel):
     """Request with TOON-encoded messages"""
+    # Strip + non-empty checks run in pydantic-core instead of Python validators
+    model_config = ConfigDict(str_strip_whitespace=True, str_min_length=1)
+
     messages_toon: str = Field(..., description="TOON-encoded conversation messages")
     use_tools: bool = Field(default=False, description="Enable tool usage (future feature)")
     session_id: str = Field(default="default", description="Session identifier")
 
-    @validator('messages_toon')
-    def validate_messages_toon(cls, v):
-        if not v or not v.strip():
-            raise ValueError("messages_toon cannot be empty")
-        return v
-
-    @validator('session_id')
-    def validate_session_id(cls, v):
-        if not v or not v.strip():
-            raise ValueError("session_id cannot be empty")
+    @field_validator('session_id')
+    @classmethod
+    def validate_session_id(cls, v: str) -> str:
         # Sanitize session_id to prevent path traversal
         return v.replace('/', '_').replace('\\', '_')
 
@@ -103,10 +133,20 @@ class ChatResponse(BaseModel):
     total_messages: int = Field(..., description="Total messages in history")
 
 
+class BatchChatRequest(BaseModel):
+    """Batch of independent chat requests answered with one concurrent LLM fan-out"""
+    items: List[ChatRequest] = Field(..., min_length=1, description="Chat requests to process")
+
+
+class BatchChatResponse(BaseModel):
+    """Responses in the same order as the batch request items"""
+    responses: List[ChatResponse] = Field(..., description="One response per request item")
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"❌ Unhandled exception: {exc}", exc_info=True)
+    logger.error("❌ Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={
@@ -118,172 +158,517 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 # Chat history management functions
-def load_chat_history(session_id: str = "default") -> List[Dict[str, str]]:
-    """Load chat history from TOON file with comprehensive logging"""
-    logger.debug(f"📖 Loading chat history for session: '{session_id}'")
-
-    if not HISTORY_FILE.exists():
-        logger.info(f"📝 No history file found, starting fresh session '{session_id}'")
+def get_history_path(session_id: str) -> Path:
+    """Resolve the JSONL log file for a session"""
+    # Sanitize session_id to prevent path traversal
+    safe_id = session_id.replace('/', '_').replace('\\', '_')
+    return HISTORY_DIR / f"{safe_id}.jsonl"
+
+
+def _serialize_message(message: Dict[str, str]) -> bytes:
+    """Serialize a single message as one JSONL line (raw UTF-8 bytes)"""
+    return orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+
+
+# In-memory session cache: session_id -> messages (populated on first load)
+# Kept in LRU order; idle sessions beyond settings.max_cached_sessions are evicted
+# and reloaded from disk on next access
+_HISTORY_CACHE: "OrderedDict[str, List[Dict[str, str]]]" = OrderedDict()
+# Per-session locks serialize disk I/O (load, append, clear) for one session only,
+# so slow writes for one session never block cache misses for another
+_SESSION_LOCKS: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+# Queued-but-unwritten batches per session; such sessions are never evicted
+_PENDING_WRITES: Dict[str, int] = defaultdict(int)
+
+# Background persistence: requests enqueue (session_id, cached_history, lines) and
+# the writer task performs one coalesced append per session per flush window
+HISTORY_FLUSH_INTERVAL = 0.1  # seconds
+_WRITE_QUEUE: "asyncio.Queue[Tuple[str, List[Dict[str, str]], List[bytes]]]" = asyncio.Queue()
+_writer_task: Optional[asyncio.Task] = None
+
+
+async def load_chat_history(session_id: str = "default") -> List[Dict[str, str]]:
+    """Load chat history from the session cache, falling back to the JSONL log"""
+    logger.debug("📖 Loading chat history for session: '%s'", session_id)
+
+    cached = _HISTORY_CACHE.get(session_id)
+    if cached is not None:
+        logger.debug("⚡ Cache hit: %s messages for session '%s'", len(cached), session_id)
+        _HISTORY_CACHE.move_to_end(session_id)
+        return cached
+
+    async with _SESSION_LOCKS[session_id]:
+        # Another request may have populated the cache while we waited for the lock
+        cached = _HISTORY_CACHE.get(session_id)
+        if cached is not None:
+            _HISTORY_CACHE.move_to_end(session_id)
+            return cached
+
+        try:
+            history = await _read_session_log(session_id)
+        except Exception as e:
+            # Still cache the recovered (empty) list so new turns are persisted rather
+            # than queued against an uncached list and discarded by the writer
+            logger.error("❌ Error loading chat history for session '%s': %s", session_id, e, exc_info=True)
+            history = []
+
+        _HISTORY_CACHE[session_id] = history
+        _evict_idle_sessions()
+        return history
+
+
+async def _read_session_log(session_id: str) -> List[Dict[str, str]]:
+    """Read and parse a session's JSONL log (empty if it doesn't exist yet)"""
+    try:
+        # Binary mode: orjson parses UTF-8 bytes directly, skipping str decoding
+        async with aiofiles.open(get_history_path(session_id), 'rb') as f:
+            content = await f.read()
+    except FileNotFoundError:
+        logger.info("📝 No history file found, starting fresh session '%s'", session_id)
         return []
 
-    try:
-        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-            all_sessions_toon = f.read()
+    *lines, tail = content.split(b"\n")
+
+    history = []
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            record = None
+        if isinstance(record, dict):
+            history.append(record)
+        else:
+            logger.warning("⚠️  Skipping malformed line %s in history for session '%s'", line_no, session_id)
+
+    # A trailing fragment without a newline is normally an append torn by a crash:
+    # drop it (or terminate it, if it is a complete record) so the next append
+    # starts on a fresh line instead of being glued onto it
+    if tail.strip():
+        try:
+            record = orjson.loads(tail)
+            if isinstance(record, dict):
+                history.append(record)
+            else:
+                logger.warning("⚠️  Skipping malformed line %s in history for session '%s'", len(lines) + 1, session_id)
+            async with aiofiles.open(get_history_path(session_id), 'ab') as f:
+                await f.write(b"\n")
+        except orjson.JSONDecodeError:
+            logger.warning("⚠️  Truncating torn final line in history for session '%s'", session_id)
+            async with aiofiles.open(get_history_path(session_id), 'r+b') as f:
+                await f.truncate(len(content) - len(tail))
+
+    logger.info("✅ Loaded %s messages for session '%s'", len(history), session_id)
+    return history
 
-            if not all_sessions_toon.strip():
-                logger.info(f"📝 History file is empty for session '{session_id}'")
-                return []
 
-            # Decode TOON to get all sessions
-            all_history = decode(all_sessions_toon)
+async def _write_session_log(session_id: str, lines: List[bytes]) -> None:
+    """Append serialized lines to a session's JSONL log"""
+    async with aiofiles.open(get_history_path(session_id), 'ab') as f:
+        await f.write(b"".join(lines))
+
+
+def _discard_idle_lock(session_id: str) -> None:
+    """Forget a session's lock when nothing holds or waits on it"""
+    lock = _SESSION_LOCKS.get(session_id)
+    # release() marks the lock free before a woken waiter reacquires it, so waiters
+    # must be checked too or they would run under a lock newcomers no longer see
+    if lock is not None and not lock.locked() and not lock._waiters:
+        del _SESSION_LOCKS[session_id]
+
+
+def _evict_idle_sessions() -> None:
+    """Drop least recently used sessions without pending writes once the cache is full"""
+    overflow = len(_HISTORY_CACHE) - settings.max_cached_sessions
+    if overflow <= 0:
+        return
+
+    # The most recently used entry (the one just loaded) is never a candidate
+    idle = [sid for sid in list(_HISTORY_CACHE)[:-1] if not _PENDING_WRITES.get(sid)]
+    for session_id in idle[:overflow]:
+        del _HISTORY_CACHE[session_id]
+        _TOON_HISTORY_CACHE.pop(session_id, None)
+        _discard_idle_lock(session_id)
+        logger.debug("♻️  Evicted session '%s' from history cache", session_id)
+
+
+async def _write_history_batch(batch: List[Tuple[str, List[Dict[str, str]], List[bytes]]]) -> None:
+    """Append queued lines to their session logs, one write per session history list"""
+    # Group by the history object too: a session cleared mid-window has entries for
+    # both its old (stale) and new (current) list, and only the stale ones are dropped
+    grouped: Dict[Tuple[str, int], Tuple[List[Dict[str, str]], List[bytes]]] = {}
+    for session_id, history, lines in batch:
+        _, session_lines = grouped.setdefault((session_id, id(history)), (history, []))
+        session_lines.extend(lines)
+
+    for (session_id, _), (history, lines) in grouped.items():
+        try:
+            async with _SESSION_LOCKS[session_id]:
+                # Skip writes for sessions cleared since they were queued
+                if _HISTORY_CACHE.get(session_id) is not history:
+                    logger.error("❌ Discarding %s queued messages for session '%s' (history was cleared)", len(lines), session_id)
+                    continue
+
+                await _write_session_log(session_id, lines)
+
+            logger.debug("💾 Flushed %s messages for session '%s'", len(lines), session_id)
+        except Exception as e:
+            logger.error("❌ Error persisting chat history for session '%s': %s", session_id, e, exc_info=True)
+
+    for session_id, _, _ in batch:
+        _PENDING_WRITES[session_id] -= 1
+        if not _PENDING_WRITES[session_id]:
+            del _PENDING_WRITES[session_id]
+
+
+async def _history_writer_loop() -> None:
+    """Drain the write queue, batching items that arrive within one flush window"""
+    loop = asyncio.get_running_loop()
+
+    while True:
+        batch = [await _WRITE_QUEUE.get()]
+        deadline = loop.time() + HISTORY_FLUSH_INTERVAL
+
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                batch.append(await asyncio.wait_for(_WRITE_QUEUE.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
 
-            # Handle both dict and list formats
-            if isinstance(all_history, dict):
-                history = all_history.get(session_id, [])
-            else:
-                history = all_history if session_id == "default" else []
+        try:
+            await _write_history_batch(batch)
+        finally:
+            for _ in batch:
+                _WRITE_QUEUE.task_done()
 
-            logger.info(f"✅ Loaded {len(history)} messages for session '{session_id}'")
 
-            # Calculate and log storage efficiency
-            if TOON_AVAILABLE:
-                import json
-                json_size = len(json.dumps(history))
-                toon_size = len(encode(history))
-                savings = ((json_size - toon_size) / json_size * 100) if json_size > 0 else 0
-                logger.info(f"💾 Storage efficiency - JSON: {json_size}B, TOON: {toon_size}B, Savings: {savings:.1f}%")
+def make_message(role: str, content: str) -> Dict[str, str]:
+    """Build a timestamped history message"""
+    return {
+        "role": role,
+        "content": content,
+        "timestamp": datetime.now().isoformat()
+    }
 
-            return history
 
-    except Exception as e:
-        logger.error(f"❌ Error loading chat history: {e}", exc_info=True)
-        return []
+async def append_to_history(session_id: str, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Append messages to the cached history and queue them as one write"""
+    logger.debug("➕ Appending %s messages to session '%s'", len(messages), session_id)
+
+    history = await load_chat_history(session_id)
+    history.extend(messages)
+    _PENDING_WRITES[session_id] += 1
+    _WRITE_QUEUE.put_nowait((session_id, history, [_serialize_message(m) for m in messages]))
+
+    return history
+
+
+async def start_history_writer():
+    """Start the background task that persists chat history"""
+    global _writer_task
+    _writer_task = asyncio.create_task(_history_writer_loop())
+    logger.info("✍️  History writer started")
+
+
+async def stop_history_writer():
+    """Flush queued history writes and stop the background writer"""
+    if _writer_task is None:
+        return
+
+    pending = _WRITE_QUEUE.qsize()
+    await _WRITE_QUEUE.join()
+    _writer_task.cancel()
+    logger.info("✍️  History writer stopped (%s queued writes flushed)", pending)
+
+
+# Async TOON helpers: payloads above this size are encoded/decoded in a worker thread
+# so large histories don't stall the event loop
+TOON_THREAD_THRESHOLD = 4096  # bytes (estimated)
+
+
+def _is_large_payload(obj: Any) -> bool:
+    """Cheaply estimate whether a payload exceeds TOON_THREAD_THRESHOLD"""
+    if isinstance(obj, (str, bytes)):
+        return len(obj) > TOON_THREAD_THRESHOLD
+
+    items = obj if isinstance(obj, list) else [obj]
+    size = 0
+    for item in items:
+        values = item.values() if isinstance(item, dict) else [item]
+        size += sum(len(v) if isinstance(v, str) else 8 for v in values)
+        if size > TOON_THREAD_THRESHOLD:
+            return True
+    return False
+
 
+async def aencode(obj: Any) -> str:
+    """Encode to TOON, off the event loop for large payloads"""
+    if _is_large_payload(obj):
+        return await asyncio.to_thread(encode, obj)
+    return encode(obj)
 
-def save_chat_history(session_id: str, messages: List[Dict[str, str]]) -> None:
-    """Save chat history to TOON file with comprehensive logging"""
-    logger.debug(f"💾 Saving {len(messages)} messages for session '{session_id}'")
+
+async def adecode(toon_str: str) -> Any:
+    """Decode TOON, off the event loop for large payloads"""
+    if _is_large_payload(toon_str):
+        return await asyncio.to_thread(decode, toon_str)
+    return decode(toon_str)
+
+
+# TOON encoding cache: session_id -> (history list, message count, header fields, encoded rows)
+# Histories are append-only, so a cached encoding stays valid for its prefix
+_TOON_HISTORY_CACHE: Dict[str, Tuple[List[Dict[str, str]], int, str, str]] = {}
+_TOON_TABULAR_HEADER = re.compile(r"\[(\d+)\]\{([^}]*)\}:\n")
+
+# Standard history message shape, whose TOON table header is known up front
+HISTORY_FIELDS = ("role", "content", "timestamp")
+HISTORY_TOON_FIELDS = ",".join(HISTORY_FIELDS)
+
+
+def _build_history_row_formatter():
+    """Build a row formatter for standard messages that skips TOON's schema inference
+
+    Returns None (callers fall back to encode) if python-toon is unavailable or its
+    output for a probe history doesn't match the formatter byte for byte.
+    """
+    if not TOON_AVAILABLE:
+        return None
 
     try:
-        # Load existing history for all sessions
-        all_history = {}
-        if HISTORY_FILE.exists():
-            with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if content:
-                    all_history = decode(content)
-                    if not isinstance(all_history, dict):
-                        all_history = {"default": all_history}
-
-        # Update this session's history
-        all_history[session_id] = messages
-
-        # Encode entire structure to TOON
-        all_sessions_toon = encode(all_history)
-
-        # Save TOON to file
-        with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-            f.write(all_sessions_toon)
-
-        # Calculate and log efficiency
-        if TOON_AVAILABLE:
-            import json
-            json_size = len(json.dumps(all_history))
-            toon_size = len(all_sessions_toon)
-            savings = ((json_size - toon_size) / json_size * 100) if json_size > 0 else 0
-            logger.info(f"✅ Saved {len(messages)} messages to TOON file")
-            logger.info(f"💾 File efficiency - JSON: {json_size}B, TOON: {toon_size}B, Savings: {savings:.1f}%")
-        else:
-            logger.info(f"✅ Saved {len(messages)} messages to JSON file")
+        from toon.primitives import encode_primitive
+    except ImportError:
+        return None
 
-    except Exception as e:
-        logger.error(f"❌ Error saving chat history: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to save chat history: {str(e)}")
+    field_set = frozenset(HISTORY_FIELDS)
 
+    def format_rows(messages: List[Dict[str, str]]) -> Optional[str]:
+        rows = []
+        for message in messages:
+            if not isinstance(message, dict) or message.keys() != field_set:
+                return None
+            values = [message[field] for field in HISTORY_FIELDS]
+            if any(isinstance(v, (dict, list)) for v in values):
+                return None
+            rows.append("  " + ",".join(encode_primitive(v) for v in values))
+        return "\n".join(rows)
 
-def append_to_history(session_id: str, role: str, content: str) -> List[Dict[str, str]]:
-    """Append a single message to chat history"""
-    logger.debug(f"➕ Appending {role} message to session '{session_id}'")
+    probe = [
+        {"role": "user", "content": 'Hi, "there"\nkey: value', "timestamp": "2024-01-01T00:00:00"},
+        {"role": "assistant", "content": " padded ", "timestamp": "true"},
+        {"role": "user", "content": "", "timestamp": "42"}
+    ]
+    expected = encode(probe)
+    header = _TOON_TABULAR_HEADER.match(expected)
 
-    history = load_chat_history(session_id)
-    history.append({
-        "role": role,
-        "content": content,
-        "timestamp": datetime.now().isoformat()
-    })
-    save_chat_history(session_id, history)
+    if header is None or header.group(2) != HISTORY_TOON_FIELDS or format_rows(probe) != expected[header.end():]:
+        logger.warning("⚠️  TOON output differs from the cached history header, using full encode")
+        return None
 
-    return history
+    return format_rows
+
+
+_format_history_rows = _build_history_row_formatter()
+
+
+def _encode_history_rows(messages: List[Dict[str, str]]) -> Optional[Tuple[str, str]]:
+    """Encode messages as TOON table rows, returning (header fields, rows) or None if not tabular"""
+    if _format_history_rows is not None:
+        rows = _format_history_rows(messages)
+        if rows is not None:
+            return HISTORY_TOON_FIELDS, rows
+
+    if not TOON_AVAILABLE:
+        return None
+
+    history_toon = encode(messages)
+    header = _TOON_TABULAR_HEADER.match(history_toon)
+    return (header.group(2), history_toon[header.end():]) if header else None
+
+
+async def encode_history(session_id: str, history: List[Dict[str, str]]) -> str:
+    """Encode a session's history to TOON, re-encoding only messages added since the last call"""
+    cached = _TOON_HISTORY_CACHE.get(session_id)
+    total = len(history)
+
+    if cached and cached[0] is history and cached[1] <= total:
+        _, count, fields, rows = cached
+
+        if count < total:
+            tail = _encode_history_rows(history[count:])
+            # Only splice when the tail uses the same tabular layout as the prefix
+            if tail is None or tail[0] != fields:
+                return await _encode_and_cache_history(session_id, history)
+            rows = rows + "\n" + tail[1]
+            _TOON_HISTORY_CACHE[session_id] = (history, total, fields, rows)
+
+        return f"[{total}]{{{fields}}}:\n{rows}"
+
+    return await _encode_and_cache_history(session_id, history)
+
+
+async def _encode_and_cache_history(session_id: str, history: List[Dict[str, str]]) -> str:
+    """Fully encode a history and cache it if TOON rendered it as a line-appendable table"""
+    # Snapshot first: the cached list may grow while a worker thread encodes it
+    snapshot = list(history)
+
+    # Fast path: standard messages are formatted directly under the known header
+    if _format_history_rows is not None and snapshot:
+        if _is_large_payload(snapshot):
+            rows = await asyncio.to_thread(_format_history_rows, snapshot)
+        else:
+            rows = _format_history_rows(snapshot)
+
+        if rows is not None:
+            _TOON_HISTORY_CACHE[session_id] = (history, len(snapshot), HISTORY_TOON_FIELDS, rows)
+            return f"[{len(snapshot)}]{{{HISTORY_TOON_FIELDS}}}:\n{rows}"
+
+    history_toon = await aencode(snapshot)
+
+    header = _TOON_TABULAR_HEADER.match(history_toon) if TOON_AVAILABLE else None
+    if header is not None:
+        _TOON_HISTORY_CACHE[session_id] = (history, len(snapshot), header.group(2), history_toon[header.end():])
+    else:
+        _TOON_HISTORY_CACHE.pop(session_id, None)
+
+    return history_toon
 
 
 # LLM initialization
-def get_llm():
-    """Initialize Gemini LLM with error handling"""
-    model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
-    api_key = os.getenv("GOOGLE_API_KEY")
+def create_llm() -> Optional[ChatGoogleGenerativeAI]:
+    """Initialize the shared Gemini LLM client (reused across requests)"""
+    model_name = settings.gemini_model
+    api_key = settings.google_api_key
 
-    logger.debug(f"🤖 Initializing LLM: {model_name}")
+    logger.debug("🤖 Initializing LLM: %s", model_name)
 
     if not api_key:
         logger.error("❌ GOOGLE_API_KEY not configured!")
-        raise HTTPException(
-            status_code=500,
-            detail="GOOGLE_API_KEY environment variable is not set"
-        )
+        return None
 
     try:
         llm = ChatGoogleGenerativeAI(
             model=model_name,
             google_api_key=api_key,
-            temperature=0.7,
-            convert_system_message_to_human=True
+            temperature=0.7
         )
-        logger.debug(f"✅ LLM initialized successfully")
+        logger.info("✅ LLM initialized successfully: %s", model_name)
         return llm
     except Exception as e:
-        logger.error(f"❌ Failed to initialize LLM: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to initialize LLM: {str(e)}")
+        logger.error("❌ Failed to initialize LLM: %s", e, exc_info=True)
+        return None
+
+
+def init_llm():
+    """Build the LLM client once so its connection pool is reused across requests"""
+    app.state.llm = create_llm()
+
+
+def get_llm() -> ChatGoogleGenerativeAI:
+    """Return the shared LLM client created at startup"""
+    llm = getattr(app.state, "llm", None)
+
+    if llm is None:
+        raise HTTPException(
+            status_code=500,
+            detail="LLM is not initialized - check that GOOGLE_API_KEY is set"
+        )
+
+    return llm
+
+
+# Prompt templates (built once, filled per request)
+# The system prompt is sent as a SystemMessage, which Gemini receives as a native system instruction
+SYSTEM_MESSAGE = SystemMessage(
+    content="You are a helpful AI assistant. Conversation history, when present, is given in TOON format "
+            "(a compact data format where field names are declared once, followed by row data)."
+)
+
+HISTORY_PROMPT_TEMPLATE = """Previous conversation (TOON format):
+{history_toon}
+
+Current user message: {current_message}
+
+Please provide a helpful response based on the conversation context above."""
 
 
 def prepare_messages_with_history(
     current_message: str,
     history: List[Dict[str, str]]
-) -> str:
+) -> List[BaseMessage]:
     """Prepare messages with conversation history in TOON format for token efficiency"""
-    logger.debug(f"📝 Preparing messages with {len(history)} historical messages")
+    logger.debug("📝 Preparing messages with %s historical messages", len(history))
 
     # Encode conversation history in TOON format for compact representation
     if history and len(history) > 0:
         history_toon = encode(history)
 
-        # Log token efficiency
-        if TOON_AVAILABLE:
-            import json
+        # Log token efficiency (only computed when DEBUG logging is enabled)
+        if TOON_AVAILABLE and logger.isEnabledFor(logging.DEBUG):
             # Compare TOON vs traditional message format
-            json_size = len(json.dumps(history))
+            json_size = len(orjson.dumps(history))
             toon_size = len(history_toon)
             savings = ((json_size - toon_size) / json_size * 100) if json_size > 0 else 0
-            logger.info(f"📊 LLM Context efficiency: JSON={json_size}B, TOON={toon_size}B, Savings={savings:.1f}%")
+            logger.debug("📊 LLM Context efficiency: JSON=%sB, TOON=%sB, Savings=%.1f%%", json_size, toon_size, savings)
 
         # Create prompt with TOON-encoded history
-        prompt = f"""You are a helpful AI assistant. Below is the conversation history in TOON format (a compact data format where field names are declared once, followed by row data).
+        prompt = HISTORY_PROMPT_TEMPLATE.format(history_toon=history_toon, current_message=current_message)
+    else:
+        # No history, just current message
+        prompt = current_message
 
-Previous conversation (TOON format):
-{history_toon}
+    logger.debug("✅ Prepared prompt with TOON-encoded history (%s chars)", len(prompt))
+    return [SYSTEM_MESSAGE, HumanMessage(content=prompt)]
 
-Current user message: {current_message}
 
-Please provide a helpful response based on the conversation context above."""
+async def prepare_chat_prompt(request: ChatRequest) -> Tuple[str, List[BaseMessage]]:
+    """Decode the request, load the session window and build the LLM prompt"""
+    # Decode TOON to get current messages
+    logger.debug("🔍 Decoding TOON input (%s chars)", len(request.messages_toon))
+    messages_data = await adecode(request.messages_toon)
+
+    # Handle both dict and list formats
+    if isinstance(messages_data, dict):
+        current_messages = messages_data.get("messages", [])
     else:
-        # No history, just current message
-        prompt = f"""You are a helpful AI assistant.
+        current_messages = messages_data
+
+    logger.info("📨 Decoded %s current messages", len(current_messages))
+
+    # Get the last user message (normally the final entry, so check that first)
+    if current_messages and current_messages[-1].get("role") == "user":
+        user_message = current_messages[-1].get("content", "")
+    else:
+        user_message = next(
+            (m.get("content", "") for m in reversed(current_messages) if m.get("role") == "user"),
+            None
+        )
+
+    if not user_message:
+        logger.warning("⚠️  No user message found in request")
+        raise HTTPException(status_code=400, detail="No user message found in request")
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("👤 User message: '%s%s'", user_message[:100], '...' if len(user_message) > 100 else '')
 
-User message: {current_message}
+    # Load conversation history from the session log
+    full_history = await load_chat_history(request.session_id)
+    logger.info("📚 Loaded %s total messages from history", len(full_history))
 
-Please provide a helpful response."""
+    # MESSAGE WINDOWING - Only send recent messages to LLM
+    WINDOW_SIZE = settings.history_window_size
+    recent_history = full_history[-WINDOW_SIZE:] if len(full_history) > WINDOW_SIZE else full_history
 
-    logger.debug(f"✅ Prepared prompt with TOON-encoded history ({len(prompt)} chars)")
-    return prompt
+    if len(full_history) > WINDOW_SIZE:
+        logger.info("🪟 Windowing: Sending %s messages (out of %s total)", len(recent_history), len(full_history))
+        logger.info("💰 Token savings: Skipping %s older messages", len(full_history) - len(recent_history))
+    else:
+        logger.info("📊 Sending all %s messages (under window size)", len(recent_history))
+
+    # Prepare prompt with TOON-encoded history
+    messages_with_toon_history = prepare_messages_with_history(user_message, recent_history)
+
+    return user_message, messages_with_toon_history
 
 
 @app.post("/api/chat", response_model=ChatResponse)
@@ -297,67 +682,29 @@ async def chat(request: ChatRequest):
     - Message windowing for token optimization
     - Multi-session support
     """
-    logger.info(f"💬 Chat request received for session '{request.session_id}'")
+    logger.info("💬 Chat request received for session '%s'", request.session_id)
     request_start = datetime.now()
 
     try:
-        # Decode TOON to get current messages
-        logger.debug(f"🔍 Decoding TOON input ({len(request.messages_toon)} chars)")
-        messages_data = decode(request.messages_toon)
-
-        # Handle both dict and list formats
-        if isinstance(messages_data, dict):
-            current_messages = messages_data.get("messages", [])
-        else:
-            current_messages = messages_data
-
-        logger.info(f"📨 Decoded {len(current_messages)} current messages")
-
-        # Get the last user message
-        user_message = None
-        for msg in reversed(current_messages):
-            if msg.get("role") == "user":
-                user_message = msg.get("content", "")
-                break
-
-        if not user_message:
-            logger.warning("⚠️  No user message found in request")
-            raise HTTPException(status_code=400, detail="No user message found in request")
-
-        logger.info(f"👤 User message: '{user_message[:100]}{'...' if len(user_message) > 100 else ''}'")
-
-        # Load conversation history from TOON file
-        full_history = load_chat_history(request.session_id)
-        logger.info(f"📚 Loaded {len(full_history)} total messages from history")
-
-        # MESSAGE WINDOWING - Only send recent messages to LLM
-        WINDOW_SIZE = int(os.getenv("HISTORY_WINDOW_SIZE", "10"))
-        recent_history = full_history[-WINDOW_SIZE:] if len(full_history) > WINDOW_SIZE else full_history
-
-        if len(full_history) > WINDOW_SIZE:
-            logger.info(f"🪟 Windowing: Sending {len(recent_history)} messages (out of {len(full_history)} total)")
-            logger.info(f"💰 Token savings: Skipping {len(full_history) - len(recent_history)} older messages")
-        else:
-            logger.info(f"📊 Sending all {len(recent_history)} messages (under window size)")
-
-        # Prepare prompt with TOON-encoded history
-        prompt_with_toon_history = prepare_messages_with_history(user_message, recent_history)
+        user_message, messages_with_toon_history = await prepare_chat_prompt(request)
 
         # Get LLM and generate response
-        logger.info(f"🤖 Invoking LLM with TOON-formatted context...")
+        logger.info("🤖 Invoking LLM with TOON-formatted context...")
         llm = get_llm()
-        response = await llm.ainvoke(prompt_with_toon_history)
-
-        response_preview = response.content[:100] + ('...' if len(response.content) > 100 else '')
-        logger.info(f"✅ LLM response: '{response_preview}'")
+        response = await llm.ainvoke(messages_with_toon_history)
 
-        # Save user message to history
-        append_to_history(request.session_id, "user", user_message)
+        if logger.isEnabledFor(logging.INFO):
+            response_preview = response.content[:100] + ('...' if len(response.content) > 100 else '')
+            logger.info("✅ LLM response: '%s'", response_preview)
 
-        # Save assistant response to history
-        updated_full_history = append_to_history(request.session_id, "assistant", response.content)
+        # Append user message and assistant response to the session log in one update
+        updated_full_history = await append_to_history(request.session_id, [
+            make_message("user", user_message),
+            make_message("assistant", response.content)
+        ])
 
-        logger.info(f"📝 Updated history: {len(updated_full_history)} total messages")
+        total_messages = len(updated_full_history)
+        logger.info("📝 Updated history: %s total messages", total_messages)
 
         # Create response object
         response_data = {
@@ -366,88 +713,230 @@ async def chat(request: ChatRequest):
         }
 
         # Encode response to TOON
-        response_toon = encode(response_data)
-        history_toon = encode(updated_full_history)
+        response_toon = await aencode(response_data)
+        history_toon = await encode_history(request.session_id, updated_full_history)
 
-        # Log TOON efficiency stats
-        if TOON_AVAILABLE:
-            import json
-            json_size = len(json.dumps(updated_full_history))
+        # Log TOON efficiency stats (only computed when DEBUG logging is enabled)
+        if TOON_AVAILABLE and logger.isEnabledFor(logging.DEBUG):
+            json_size = len(orjson.dumps(updated_full_history))
             toon_size = len(history_toon)
             savings = ((json_size - toon_size) / json_size) * 100 if json_size > 0 else 0
-            logger.info(f"📊 Transmission efficiency: JSON={json_size}B, TOON={toon_size}B, Savings={savings:.1f}%")
+            logger.debug("📊 Transmission efficiency: JSON=%sB, TOON=%sB, Savings=%.1f%%", json_size, toon_size, savings)
 
         # Log request duration
         duration = (datetime.now() - request_start).total_seconds()
-        logger.info(f"⏱️  Request completed in {duration:.2f}s")
+        logger.info("⏱️  Request completed in %.2fs", duration)
 
         return ChatResponse(
             response_toon=response_toon,
             history_toon=history_toon,
-            total_messages=len(updated_full_history)
+            total_messages=total_messages
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error processing chat request: {e}", exc_info=True)
-        # Return error in TOON format
-        error_data = {
-            "role": "assistant",
-            "content": f"I encountered an error: {str(e)}. Please try again."
-        }
+        logger.error("❌ Error processing chat request: %s", e, exc_info=True)
+        return error_chat_response(str(e))
+
+
+def error_chat_response(message: str) -> ChatResponse:
+    """Build a ChatResponse carrying an error message in TOON format"""
+    error_data = {
+        "role": "assistant",
+        "content": f"I encountered an error: {message}. Please try again."
+    }
+    return ChatResponse(
+        response_toon=encode(error_data),
+        history_toon=encode([]),
+        total_messages=0
+    )
+
+
+@app.post("/api/chat/batch", response_model=BatchChatResponse)
+async def chat_batch(request: BatchChatRequest):
+    """
+    Batch chat endpoint - answers several TOON-encoded chat requests in one round trip
+
+    Prompts are dispatched concurrently via llm.abatch (bounded by BATCH_MAX_CONCURRENCY);
+    a failing item yields an error response without affecting the others.
+    Items sharing a session_id all see the history as it was before the batch.
+    """
+    logger.info("📦 Batch chat request received with %s items", len(request.items))
+    request_start = datetime.now()
+
+    llm = get_llm()
+
+    prepared = await asyncio.gather(
+        *(prepare_chat_prompt(item) for item in request.items),
+        return_exceptions=True
+    )
+    valid = [i for i, p in enumerate(prepared) if not isinstance(p, BaseException)]
+
+    max_concurrency = settings.batch_max_concurrency
+    logger.info("🤖 Invoking LLM for %s prompts (max concurrency %s)...", len(valid), max_concurrency)
+    results = await llm.abatch(
+        [prepared[i][1] for i in valid],
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True
+    ) if valid else []
+    llm_results = dict(zip(valid, results))
+
+    async def finish_item(index: int) -> ChatResponse:
+        item = request.items[index]
+        outcome = llm_results.get(index, prepared[index])
+
+        if isinstance(outcome, HTTPException):
+            return error_chat_response(str(outcome.detail))
+        if isinstance(outcome, BaseException):
+            logger.error("❌ Batch item %s failed: %s", index, outcome)
+            return error_chat_response(str(outcome))
+
+        user_message = prepared[index][0]
+        updated_full_history = await append_to_history(item.session_id, [
+            make_message("user", user_message),
+            make_message("assistant", outcome.content)
+        ])
+        total_messages = len(updated_full_history)
         return ChatResponse(
-            response_toon=encode(error_data),
-            history_toon=encode([]),
-            total_messages=0
+            response_toon=await aencode({"role": "assistant", "content": outcome.content}),
+            history_toon=await encode_history(item.session_id, updated_full_history),
+            total_messages=total_messages
         )
 
+    responses = await asyncio.gather(*(finish_item(i) for i in range(len(request.items))))
+
+    duration = (datetime.now() - request_start).total_seconds()
+    logger.info("⏱️  Batch of %s completed in %.2fs", len(request.items), duration)
+
+    return BatchChatResponse(responses=responses)
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_BACKGROUND_TASKS: Set[asyncio.Task] = set()
+
+
+def format_sse(data: Any, event: Optional[str] = None) -> str:
+    """Format a TOON-encoded Server-Sent Event (multi-line payloads get one data: line each)"""
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in encode(data).split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming chat endpoint - emits TOON-encoded response deltas as Server-Sent Events
+
+    Events:
+    - default `data:` events carry `{delta}` chunks as they are generated
+    - a final `done` event carries the full response and history size
+    - an `error` event is sent if generation fails mid-stream
+
+    If the client disconnects (or generation fails) after some tokens were produced,
+    the user message and the partial assistant response are still recorded.
+    """
+    logger.info("💬 Streaming chat request received for session '%s'", request.session_id)
+    request_start = datetime.now()
+
+    # Validation errors surface as regular HTTP errors before the stream starts
+    user_message, messages_with_toon_history = await prepare_chat_prompt(request)
+    llm = get_llm()
+
+    async def event_stream():
+        chunks: List[str] = []
+        persisted = False
+
+        try:
+            logger.info("🤖 Streaming LLM response with TOON-formatted context...")
+            async for chunk in llm.astream(messages_with_toon_history):
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield format_sse({"delta": chunk.content})
+
+            content = "".join(chunks)
+            updated_full_history = await append_to_history(request.session_id, [
+                make_message("user", user_message),
+                make_message("assistant", content)
+            ])
+            persisted = True
+
+            yield format_sse(
+                {"role": "assistant", "content": content, "total_messages": len(updated_full_history)},
+                event="done"
+            )
+
+            duration = (datetime.now() - request_start).total_seconds()
+            logger.info("⏱️  Streaming request completed in %.2fs (%s chunks)", duration, len(chunks))
+
+        except Exception as e:
+            logger.error("❌ Error streaming chat response: %s", e, exc_info=True)
+            yield format_sse({"error": str(e)}, event="error")
+
+        finally:
+            # A disconnect surfaces here as GeneratorExit/CancelledError, where awaiting is
+            # unreliable, so the partial turn is recorded from a separate task
+            if not persisted and chunks:
+                logger.warning("⚠️  Stream for session '%s' ended early, saving partial response (%s chunks)",
+                               request.session_id, len(chunks))
+                task = asyncio.create_task(append_to_history(request.session_id, [
+                    make_message("user", user_message),
+                    make_message("assistant", "".join(chunks))
+                ]))
+                _BACKGROUND_TASKS.add(task)
+                task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 
 @app.get("/api/health")
 async def health():
     """Health check endpoint with comprehensive system info"""
     logger.debug("🏥 Health check requested")
 
-    model = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
-    has_api_key = bool(os.getenv("GOOGLE_API_KEY"))
-    window_size = int(os.getenv("HISTORY_WINDOW_SIZE", "10"))
+    model = settings.gemini_model
+    has_api_key = bool(settings.google_api_key)
+    window_size = settings.history_window_size
+    stored_sessions = await asyncio.to_thread(lambda: sum(1 for _ in HISTORY_DIR.glob("*.jsonl")))
 
     health_status = {
         "status": "healthy" if has_api_key else "degraded",
         "model": model,
         "toon_version": "standard" if TOON_AVAILABLE else "json-fallback",
         "api_key_configured": has_api_key,
-        "history_file_exists": HISTORY_FILE.exists(),
-        "storage_format": "TOON" if TOON_AVAILABLE else "JSON",
+        "stored_sessions": stored_sessions,
+        "storage_format": "JSONL",
         "history_window_size": window_size,
         "features": [
             "conversation_history",
-            "messages_placeholder",
             "toon_format" if TOON_AVAILABLE else "json_fallback",
-            "toon_file_storage",
+            "append_only_storage",
             "message_windowing",
             "multi_session"
         ],
         "timestamp": datetime.now().isoformat()
     }
 
-    logger.info(f"🏥 Health: {health_status['status']}")
+    logger.info("🏥 Health: %s", health_status['status'])
     return health_status
 
 
 @app.get("/api/history/{session_id}")
 async def get_history(session_id: str = "default"):
     """Get conversation history for a session"""
-    logger.info(f"📖 History request for session '{session_id}'")
+    logger.info("📖 History request for session '%s'", session_id)
 
     try:
-        history = load_chat_history(session_id)
-        history_toon = encode(history)
+        history = await load_chat_history(session_id)
+        history_toon = await encode_history(session_id, history)
 
         # Calculate storage savings
         if TOON_AVAILABLE:
-            import json
-            json_size = len(json.dumps(history))
+            json_size = len(orjson.dumps(history))
             toon_size = len(history_toon)
             savings = ((json_size - toon_size) / json_size * 100) if json_size > 0 else 0
         else:
@@ -465,34 +954,30 @@ async def get_history(session_id: str = "default"):
             }
         }
     except Exception as e:
-        logger.error(f"❌ Error getting history: {e}", exc_info=True)
+        logger.error("❌ Error getting history: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/api/history/{session_id}")
 async def clear_history(session_id: str = "default"):
     """Clear conversation history for a session"""
-    logger.info(f"🗑️  Clearing history for session '{session_id}'")
+    logger.info("🗑️  Clearing history for session '%s'", session_id)
 
     try:
-        if HISTORY_FILE.exists():
-            with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if content:
-                    all_history = decode(content)
-
-                    if isinstance(all_history, dict) and session_id in all_history:
-                        message_count = len(all_history[session_id])
-                        del all_history[session_id]
-
-                        with open(HISTORY_FILE, 'w', encoding='utf-8') as fw:
-                            fw.write(encode(all_history))
+        async with _SESSION_LOCKS[session_id]:
+            # Queued appends for this session are dropped once its cache entry is gone
+            _HISTORY_CACHE.pop(session_id, None)
+            _TOON_HISTORY_CACHE.pop(session_id, None)
 
-                        logger.info(f"✅ Cleared {message_count} messages for session '{session_id}'")
+            try:
+                await aiofiles.os.remove(get_history_path(session_id))
+                logger.info("✅ Cleared history file for session '%s'", session_id)
+            except FileNotFoundError:
+                logger.debug("📝 No history file to clear for session '%s'", session_id)
 
         return {"status": "success", "message": f"History cleared for session '{session_id}'"}
     except Exception as e:
-        logger.error(f"❌ Error clearing history: {e}", exc_info=True)
+        logger.error("❌ Error clearing history: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -508,7 +993,6 @@ async def root():
         "features": [
             "TOON format encoding/decoding" if TOON_AVAILABLE else "JSON format (TOON library not installed)",
             "Conversation history persistence",
-            "LangChain MessagesPlaceholder",
             "Multi-session support",
             "Token efficiency tracking",
             "Message windowing",
@@ -517,6 +1001,8 @@ async def root():
         "endpoints": {
             "health": "/api/health",
             "chat": "/api/chat",
+            "chat_stream": "/api/chat/stream",
+            "chat_batch": "/api/chat/batch",
             "history": "/api/history/{session_id}",
             "docs": "/docs"
         }
@@ -526,14 +1012,14 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
-    port = int(os.getenv("PORT", "8000"))
-    host = os.getenv("HOST", "0.0.0.0")
+    port = settings.port
+    host = settings.host
 
     logger.info("=" * 80)
-    logger.info(f"🚀 Starting TOON Chat Backend")
-    logger.info(f"🌐 Server: http://{host}:{port}")
-    logger.info(f"📚 API Docs: http://{host}:{port}/docs")
-    logger.info(f"💾 History stored in TOON format: {TOON_AVAILABLE}")
+    logger.info("🚀 Starting TOON Chat Backend")
+    logger.info("🌐 Server: http://%s:%s", host, port)
+    logger.info("📚 API Docs: http://%s:%s/docs", host, port)
+    logger.info("💾 History stored as JSONL in: %s", HISTORY_DIR.absolute())
     logger.info("=" * 80)
 
     uvicorn.run(
@@ -25,7 +25,7 @@ export interface HealthResponse {
   model: string;
   toon_version: string;
   api_key_configured: boolean;
-  history_file_exists: boolean;
+  stored_sessions: number;
   storage_format: string;
   history_window_size: number;
   features: string[];